@@ -1,5 +1,4 @@
 """Module for reading and writing Sofa files with sofar."""
-import contextlib
 import os
 import numpy as np
 from netCDF4 import Dataset, chartostring, stringtochar
@@ -7,7 +6,18 @@ import warnings
 import pathlib
 from packaging.version import parse
 import sofar as sf
-from .utils import _verify_convention_and_version, _atleast_nd
+from .utils import (_verify_convention_and_version, _atleast_nd,
+                    _latest_version)
+
+# variables smaller than this are written without compression (in bytes)
+_MIN_COMPRESSION_NBYTES = 2048
+# data that is not converted to scalars when reading SOFA files
+_DATA_KEYS = frozenset(
+    ["Data_IR", "Data_Real", "Data_Imag", "Data_SOS", "Data_Delay"])
+# maximum size of chunks of compressed variables (in bytes). Each chunk is
+# decompressed as a whole, so smaller chunks along the leading dimension mean
+# that reading parts of a variable decompresses less data
+_MAX_CHUNK_NBYTES = 2**20
 
 
 def read_sofa(filename, verify='auto', verbose=True):
@@ -119,8 +129,8 @@ def _read_netcdf(filename, verify, verbose, mode):
     # attributes that are skipped
     skip = ["_Encoding"]
 
-    # init list of all and custom attributes
-    all_attr = []
+    # init set of all and list of custom attributes
+    all_attr = set()
     custom = []
 
     # open new NETCDF4 file for reading
@@ -142,51 +152,57 @@ def _read_netcdf(filename, verify, verbose, mode):
         # allow writing read only attributes
         sofa.protected = False
 
-        # load global attributes
-        for attr in file.ncattrs():
+        # data of the Sofa object. Existing entries are written directly to
+        # avoid the checks in Sofa.__setattr__, which are not required here
+        data = sofa.__dict__
+
+        # load global attributes. The attributes of the file and its
+        # variables are read at once through __dict__
+        for attr, value in file.__dict__.items():
 
-            value = getattr(file, attr)
-            all_attr.append(f"GLOBAL_{attr}")
+            all_attr.add(f"GLOBAL_{attr}")
 
-            if not hasattr(sofa, f"GLOBAL_{attr}"):
+            if f"GLOBAL_{attr}" not in data:
                 sofa._add_custom_api_entry(
                     f"GLOBAL_{attr}", value, None, None, "attribute")
                 custom.append(f"GLOBAL_{attr}")
                 sofa.protected = False
             else:
-                setattr(sofa, f"GLOBAL_{attr}", value)
+                data[f"GLOBAL_{attr}"] = sofa._format_value(value)
 
         # load data
-        for var in file.variables.keys():
+        for var, variable in file.variables.items():
 
-            value = _format_value_from_netcdf(file[var][:], var)
-            all_attr.append(var.replace(".", "_"))
+            name = var.replace(".", "_")
+            value = _format_value_from_netcdf(variable[:], name)
+            all_attr.add(name)
 
-            if hasattr(sofa, var.replace(".", "_")):
-                setattr(sofa, var.replace(".", "_"), value)
+            if name in data:
+                data[name] = sofa._format_value(value)
             else:
-                dimensions = "".join(list(file[var].dimensions))
+                dimensions = "".join(variable.dimensions)
                 # SOFA only uses dtypes 'double' and 'S1' but netCDF has more
-                dtype = "string" if file[var].datatype == "S1" else "double"
-                sofa._add_custom_api_entry(var.replace(".", "_"), value, None,
+                dtype = "string" if variable.datatype == "S1" else "double"
+                sofa._add_custom_api_entry(name, value, None,
                                            dimensions, dtype)
-                custom.append(var.replace(".", "_"))
+                custom.append(name)
                 sofa.protected = False
 
             # load variable attributes
-            for attr in [a for a in file[var].ncattrs() if a not in skip]:
+            for attr, value in variable.__dict__.items():
 
-                value = getattr(file[var], attr)
-                all_attr.append(var.replace(".", "_") + "_" + attr)
+                if attr in skip:
+                    continue
 
-                if not hasattr(sofa, var.replace(".", "_") + "_" + attr):
+                all_attr.add(name + "_" + attr)
+
+                if name + "_" + attr not in data:
                     sofa._add_custom_api_entry(
-                        var.replace(".", "_") + "_" + attr, value, None,
-                        None, "attribute")
-                    custom.append(var.replace(".", "_") + "_" + attr)
+                        name + "_" + attr, value, None, None, "attribute")
+                    custom.append(name + "_" + attr)
                     sofa.protected = False
                 else:
-                    setattr(sofa, var.replace(".", "_") + "_" + attr, value)
+                    data[name + "_" + attr] = sofa._format_value(value)
 
     # remove fields from initial Sofa object that were not contained in NetCDF
     # file (initial Sofa object contained mandatory and optional fields)
@@ -212,7 +228,7 @@ def _read_netcdf(filename, verify, verbose, mode):
     if verify:
         try:
             sofa.verify(mode="read")
-        except:  # noqa: E722
+        except Exception:
             raise ValueError((
                 "The SOFA object could not be verified, maybe due to erroneous"
                 " data. Call sofa=sofar.read_sofa(filename, verify=False) and "
@@ -235,7 +251,10 @@ def write_sofa(filename: str, sofa: sf.Sofa, compression=4):
     compression : int
         The level of compression with ``0`` being no compression and ``9``
         being the best compression. The default of ``9`` optimizes the file
-        size but increases the time for writing files to disk.
+        size but increases the time for writing files to disk. Variables
+        smaller than 2048 bytes are always written without compression,
+        because compressing them increases the file size and the time for
+        writing.
 
     Notes
     -----
@@ -270,8 +289,7 @@ def _write_sofa(filename: str, sofa: sf.Sofa, compression=4, verify=True):
         # if case required for writing SOFA test data that violates the
         # conventions
         if sofa.GLOBAL_SOFAConventions != "invalid-value":
-            latest = sf.Sofa(sofa.GLOBAL_SOFAConventions)
-            latest = latest.GLOBAL_SOFAConventionsVersion
+            latest = _latest_version(sofa.GLOBAL_SOFAConventions)
             current = sofa.GLOBAL_SOFAConventionsVersion
 
             if parse(current) < parse(latest):
@@ -281,15 +299,32 @@ def _write_sofa(filename: str, sofa: sf.Sofa, compression=4, verify=True):
                     " data with Sofa.upgrade_convention() before "
                     "writing to disk if possible."), stacklevel=2)
 
-    # setting the netCDF compression parameter
-    use_zlib = compression != 0
 
     # update the dimensions
     if verify:
         sofa.verify(mode="write")
 
-    # list of all attribute names
-    all_keys = [key for key in sofa.__dict__.keys() if not key.startswith("_")]
+    # all data and its type from the convention. The data is taken from a
+    # snapshot instead of calling getattr for each entry.
+    data = {key: value for key, value in sofa.__dict__.items()
+            if not key.startswith("_")}
+    types = {key: sofa._convention[key]["type"] for key in data}
+
+    # Note: The used definition of attributes is lax. The strict
+    # definition would parse `key` and assume an attribute if
+    # 1. "_" is in key and key does not start with "DATA_", or
+    # 2. key contains more than one "_"
+    #
+    # The strict definition is implicitly included in the SOFA standard
+    # since underscores only occur for variables starting with Data_
+    attributes = [key for key in data if types[key] == "attribute"]
+
+    # attributes of the variables grouped by the variable name
+    variable_attributes = {}
+    for key in attributes:
+        if not key.startswith("GLOBAL_") and "_" in key:
+            variable_attributes.setdefault(
+                key[:key.rindex("_")], []).append(key)
 
     # open new NETCDF4 file for writing
     with Dataset(filename, "w", format="NETCDF4") as file:
@@ -299,44 +334,73 @@ def _write_sofa(filename: str, sofa: sf.Sofa, compression=4, verify=True):
             file.createDimension(dim, sofa._api[dim])
 
         # write global attributes
-        keys = [key for key in all_keys if key.startswith("GLOBAL_")]
-        for key in keys:
-            setattr(file, key[7:], str(getattr(sofa, key)))
+        for key in attributes:
+            if key.startswith("GLOBAL_"):
+                setattr(file, key[7:], str(data[key]))
 
         # write data
-        for key in all_keys:
+        for key in data:
 
             # skip attributes
-            # Note: The used definition of attributes is lax. The strict
-            # definition would parse `key` and assume an attribute if
-            # 1. "_" is in key and key does not start with "DATA_", or
-            # 2. key contains more than one "_"
-            #
-            # The strict definition is implicitly included in the SOFA standard
-            # since underscores only occur for variables starting with Data_
-            if sofa._convention[key]["type"] == "attribute":
+            if types[key] == "attribute":
                 continue
 
             # get the data and type and shape
             value, dtype = _format_value_for_netcdf(
-                getattr(sofa, key), key, sofa._convention[key]["type"],
+                data[key], key, types[key],
                 sofa._dimensions[key], sofa._api["S"])
 
-            # create variable and write data
+            # create variable and write data. Small variables are not
+            # compressed because the chunked storage required for compression
+            # makes them larger and slower to write
             shape = list(sofa._dimensions[key])
+            use_zlib = compression != 0 and \
+                value.nbytes >= _MIN_COMPRESSION_NBYTES
+            chunks = _chunk_sizes(
+                [sofa._api[dim] for dim in shape],
+                8 if dtype == "f8" else 1) if use_zlib else None
             tmp_var = file.createVariable(
                 key.replace("Data_", "Data."), dtype, shape,
-                zlib=use_zlib, complevel=compression)
+                zlib=use_zlib, complevel=compression, chunksizes=chunks)
             if dtype == "f8":
                 tmp_var[:] = value
             else:
                 tmp_var[:] = stringtochar(value, encoding='utf-8')
 
             # write variable attributes
-            sub_keys = [k for k in all_keys if k.startswith(f"{key}_")]
-            for sub_key in sub_keys:
-                setattr(tmp_var, sub_key[len(key)+1:],
-                        str(getattr(sofa, sub_key)))
+            for sub_key in variable_attributes.get(key, []):
+                setattr(tmp_var, sub_key[len(key)+1:], str(data[sub_key]))
+
+
+def _chunk_sizes(shape, itemsize):
+    """
+    Get the chunk sizes for writing a compressed variable.
+
+    The chunks span the trailing dimensions and are split along the leading
+    dimensions until they are not larger than 1 MiB. Because each chunk is
+    decompressed as a whole, reading parts of large variables, e.g., single
+    measurements, then only decompresses the chunks that contain them instead
+    of the entire variable.
+
+    Parameters
+    ----------
+    shape : list of int
+        The shape of the variable.
+    itemsize : int
+        The size of a single element in bytes.
+
+    Returns
+    -------
+    chunks : list of int
+        The chunk sizes.
+    """
+    chunks = list(shape)
+    for idx in range(len(chunks)):
+        while chunks[idx] > 1 and \
+                np.prod(chunks) * itemsize > _MAX_CHUNK_NBYTES:
+            chunks[idx] = (chunks[idx] + 1) // 2
+
+    return chunks
 
 
 def _format_value_for_netcdf(value, key, dtype, dimensions, S):
@@ -364,11 +428,8 @@ def _format_value_for_netcdf(value, key, dtype, dimensions, S):
         The data type as a string for writing to a NETCDF4 file ('attribute',
         'f8', or 'S1').
     """
-    # copy value
-    with contextlib.suppress(AttributeError):
-        value = value.copy()
-
-    # parse data
+    # parse data (the value is not copied, because it is only read when
+    # writing to disk)
     if dtype == "attribute":
         value = str(value)
         netcdf_dtype = "attribute"
@@ -376,7 +437,9 @@ def _format_value_for_netcdf(value, key, dtype, dimensions, S):
         value = _atleast_nd(value, len(dimensions))
         netcdf_dtype = "f8"
     elif dtype == "string":
-        value = np.array(value, dtype=f"S{str(S)}")
+        # numpy encodes all strings at once when converting to fixed width
+        # bytes
+        value = np.asarray(value, dtype=f"S{S}")
         value = _atleast_nd(value, len(dimensions))
         netcdf_dtype = 'S1'
     else:
@@ -394,7 +457,8 @@ def _format_value_from_netcdf(value, key):
     value : np.array of dtype float or S
         The value to be formatted
     key : str
-        The variable name of the current value. Needed for verbose errors.
+        The name of the current value in the SOFA object, e.g., ``'Data_IR'``.
+        Needed for keeping data as arrays and for verbose errors.
 
     Returns
     -------
@@ -402,16 +466,16 @@ def _format_value_from_netcdf(value, key):
         The formatted value.
     """
 
-    if "float" in str(value.dtype) or "int" in str(value.dtype):
+    if value.dtype.kind in "fiu":
         if np.ma.is_masked(value):
             warnings.warn(f"Entry {key} contains missing data", stacklevel=3)
         else:
             # Convert to numpy array or scalar
             value = np.asarray(value)
-    elif str(value.dtype)[1] in ["S", "U"]:
+    elif value.dtype.kind in "SU":
         # string arrays are stored in masked arrays with empty strings '' being
         # masked. Convert to regular arrays with unmasked empty strings
-        if str(value.dtype)[1] == "S":
+        if value.dtype.kind == "S":
             value = chartostring(value, encoding="ascii")
         value = np.atleast_1d(value).astype("U")
     else:
@@ -420,8 +484,7 @@ def _format_value_from_netcdf(value, key):
 
     # convert arrays to scalars if they do not store data that is usually used
     # as scalar metadata, e.g., the SamplingRate
-    data_keys = ["Data_IR", "Data_Real", "Data_Imag", "Data_SOS" "Data_Delay"]
-    if value.size == 1 and key not in data_keys:
+    if value.size == 1 and key not in _DATA_KEYS:
         value = value[0]
 
     return value
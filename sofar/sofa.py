@@ -2,6 +2,7 @@
 import os
 import re
 import json
+import functools
 from datetime import datetime
 import platform
 import numpy as np
@@ -9,9 +10,26 @@ import warnings
 from packaging.version import parse
 from copy import deepcopy
 import sofar as sf
-from .utils import (_nd_newaxis, _atleast_nd, _get_conventions,
+from .utils import (_atleast_nd, _lookup_convention, _mtime,
+                    _find_conventions, _index_conventions,
                     _verify_convention_and_version)
 
+# Following the SOFA standard AES69, units may be separated by `, ` (comma and
+# space), `,` (comma only), and ` ` (space only). The patterns are compiled
+# once, because they are used for each unit that is verified.
+_UNIT_SEPARATOR = re.compile(', ?')
+_UNIT_SEPARATOR_SPACE = re.compile(', ?| ')
+
+# Translation of names in NetCDF format (e.g., 'Data.SamplingRate:Units') to
+# names in sofar format (e.g., 'Data_SamplingRate_Units')
+_TO_SOFAR = str.maketrans(".:", "__")
+
+# Python version written to GLOBAL_ApplicationVersion of new SOFA objects
+_APPLICATION_VERSION = (
+    f"{platform.python_version()} "
+    f"[{platform.python_implementation()} - "
+    f"{platform.python_compiler()}]")
+
 
 class Sofa():
     """Create a new SOFA object.
@@ -97,9 +115,7 @@ class Sofa():
             self._convention = self._load_convention(convention, version)
 
             # update read only attributes
-            self._read_only_attr = [
-                key for key in self._convention.keys()
-                if self._read_only(self._convention[key]["flags"])]
+            self._read_only_attr = self._flagged_keys()[1]
 
             # add attributes with default values
             self._convention_to_sofa(mandatory)
@@ -148,11 +164,8 @@ class Sofa():
                 "only data (e.g., to repair corrupted SOFA data)."))
 
         # convert to numpy array or scalar
-        if not isinstance(value, (str, dict, np.ndarray)) \
-                and name != "protected":
-            value = np.atleast_2d(value)
-            if value.size == 1:
-                value = value.flatten()[0]
+        if name != "protected":
+            value = self._format_value(value)
 
         super.__setattr__(self, name, value)
 
@@ -167,8 +180,7 @@ class Sofa():
         if not hasattr(self, name):
             raise TypeError(f"{name} is not an attribute")
         # delete anything if not frozen, delete non mandatory
-        if not self.protected or \
-                not self._mandatory(self._convention[name]["flags"]):
+        if not self.protected or not self._is_mandatory_key(name):
             super().__delattr__(name)
 
             # check if custom field as to be deleted
@@ -517,8 +529,9 @@ class Sofa():
         self.protected = False
 
         # loop data in convention
+        mandatory_keys = self._flagged_keys()[0]
         for key in self._convention.keys():
-            is_mandatory = self._mandatory(self._convention[key]["flags"])
+            is_mandatory = key in mandatory_keys
             add_data = (is_mandatory and mandatory) or \
                 (not is_mandatory and optional)
             # add with default
@@ -836,8 +849,8 @@ class Sofa():
         # move data
         for source, move in upgrade["move"].items():
             # get info
-            source_sofar = source.replace(".", '_').replace(":", "_")
-            target_sofar = move["target"].replace(".", '_').replace(":", "_")
+            source_sofar = source.translate(_TO_SOFAR)
+            target_sofar = move["target"].translate(_TO_SOFAR)
             move_info = f"- Moving {source_sofar} to {target_sofar}."
             # get data
             data = getattr(self, source_sofar)
@@ -848,8 +861,10 @@ class Sofa():
             if moveaxis is not None:
                 # add dimensions if required
                 # (sofar discards trailing singular dimensions)
-                while data.ndim < np.max(moveaxis) + 1:
-                    data = data[..., None]
+                ndim = np.max(moveaxis) + 1
+                if data.ndim < ndim:
+                    data = data.reshape(
+                        data.shape + (1, ) * (ndim - data.ndim))
                 # move the axis
                 data = np.moveaxis(data, moveaxis[0], moveaxis[1])
                 move_info += f" Moving axis {moveaxis[0]} to {moveaxis[1]}."
@@ -870,7 +885,7 @@ class Sofa():
 
         # remove data
         for target in upgrade["remove"]:
-            target_sofar = target.replace(".", '_').replace(":", "_")
+            target_sofar = target.translate(_TO_SOFAR)
             delattr(self, target_sofar)
             print(f"- Deleting {target_sofar}.")
 
@@ -982,34 +997,40 @@ class Sofa():
 
         # ---------------------------------------------------------------------
         # 1. check if the mandatory attributes are contained
-        missing = ""
-        keys = [key for key in self.__dict__.keys() if not key.startswith("_")]
+        missing = []
+        # snapshot of the data inside the SOFA object that is used instead of
+        # repeatedly calling getattr and hasattr in the steps below
+        data = {key: value for key, value in self.__dict__.items()
+                if not key.startswith("_")}
+        keys = list(data.keys())
+
+        mandatory = self._flagged_keys()[0]
 
         for key in self._convention.keys():
-            if self._mandatory(self._convention[key]["flags"]) \
-                    and key not in keys:
+            if key in mandatory and key not in data:
 
                 if issue_handling != "raise":
                     # add missing data with default value
                     self.protected = False
                     setattr(self, key, self._convention[key]["default"])
                     self.protected = True
+                    data[key] = getattr(self, key)
 
                 # prepare to raise warning
-                missing += "- " + key + "\n"
+                missing.append("- " + key + "\n")
 
         if missing:
             if issue_handling == "raise":
                 error_msg += ("Detected missing mandatory data "
                               "call sofa.add_missing() to fix this):\n")
-                error_msg += missing
+                error_msg += "".join(missing)
             else:
                 warning_msg += "Added mandatory data with default values:\n"
-                warning_msg += missing
+                warning_msg += "".join(missing)
 
         # ---------------------------------------------------------------------
         # 2. verify data type
-        current_error = ""
+        current_error = []
         for key in keys:
 
             # handle dimensions
@@ -1017,50 +1038,51 @@ class Sofa():
             dtype = self._convention[key]["type"]
 
             # check data type
-            value = getattr(self, key)
+            value = data[key]
 
             if dtype == "attribute":
                 if not isinstance(value, str):
-                    current_error += \
-                        f"- {key} must be string but is {type(value)}\n"
+                    current_error.append(
+                        f"- {key} must be string but is {type(value)}\n")
 
             elif dtype == "double":
                 # All variables can be of type float or int, and are converted
                 # to float when writing.
                 # sofar does not force the user to pass data as numpy arrays.
-                # We thus check for allowed instances (int, float, numpy) and
-                # specifically for the type of numpy arrays.
-                if not isinstance(
-                        value, (int, float, np.ndarray, np.number)) or \
-                        (isinstance(value, (np.ndarray, np.number)) and
-                         value.dtype.kind not in ['i', 'f']):
-                    current_error += (f"- {key} must be int or float "
-                                      f"but is {type(value)}\n")
+                # We thus check for the kind of numpy data and for allowed
+                # instances (int, float) otherwise.
+                if isinstance(value, (np.ndarray, np.number)):
+                    is_valid = value.dtype.kind in ('i', 'f')
+                else:
+                    is_valid = isinstance(value, (int, float))
+
+                if not is_valid:
+                    current_error.append(f"- {key} must be int or float "
+                                         f"but is {type(value)}\n")
 
             elif dtype == "string":
                 # multiple checks needed because sofar does not force the user
                 # to initially pass data as numpy arrays
-                if not isinstance(value, (str, np.ndarray)):
-                    current_error += (f"- {key} must be string or numpy array "
-                                      f"but is {type(value)}\n")
-
-                if isinstance(value, np.ndarray) and not (
-                        str(value.dtype).startswith('<U') or
-                        str(value.dtype).startswith('<S')):
-                    current_error += (f"- {key} must be U or S "
-                                      f"but is {type(value.dtype)}\n")
+                if isinstance(value, np.ndarray):
+                    if value.dtype.kind not in ('U', 'S'):
+                        current_error.append(f"- {key} must be U or S "
+                                             f"but is {type(value.dtype)}\n")
+                elif not isinstance(value, str):
+                    current_error.append(
+                        f"- {key} must be string or numpy array "
+                        f"but is {type(value)}\n")
 
             else:
                 # Could only be tested by manipulating JSON convention files
                 # (Could take different data types in the future and convert to
                 # numpy double arrays.)
-                current_error += (
+                current_error.append(
                     f"- {key}: Error in convention. Type must be "
                     f"double, string, or attribute but is {dtype}\n")
 
         if current_error:
             error_msg += "Detected data of wrong type:\n"
-            error_msg += current_error
+            error_msg += "".join(current_error)
 
         # if an error ocurred up to here, it has to be handled. Otherwise
         # detecting the dimensions might fail. Warnings are not reported until
@@ -1078,7 +1100,7 @@ class Sofa():
         # 3. Verify names of entries
 
         # check attributes without variables
-        current_error = ""
+        current_error = []
         for key in keys:
 
             if self._convention[key]["type"] != "attribute" or \
@@ -1087,14 +1109,14 @@ class Sofa():
 
             if (key[:key.rindex("_")] not in self._convention and
                     not key.startswith("GLOBAL_")):
-                current_error += "- " + key + "\n"
+                current_error.append("- " + key + "\n")
 
         if current_error:
             error_msg += "Detected attributes with missing variables:\n"
-            error_msg += current_error
+            error_msg += "".join(current_error)
 
         # check number of underscores
-        current_error = ""
+        current_error = []
         for key in keys:
 
             if self._convention[key]["type"] != "attribute":
@@ -1102,7 +1124,7 @@ class Sofa():
 
             # the case above caught attributes with too many underscores
             if key.count("_") == 0:
-                current_error += "- " + key + "\n"
+                current_error.append("- " + key + "\n")
 
         if current_error:
             error_msg += (
@@ -1110,64 +1132,63 @@ class Sofa():
                 " Names must have the form Variable_Attribute, Data_Attribute "
                 "(one underscore), or Data_Variable_Attribute (two "
                 "underscores):\n")
-            error_msg += current_error
+            error_msg += "".join(current_error)
 
         # check numeric variables
-        current_error = ""
+        current_error = []
         for key in keys:
 
             if self._convention[key]["type"] == "attribute":
                 continue
 
             if "_" in key.replace("Data_", ""):
-                current_error += "- " + key + "\n"
+                current_error.append("- " + key + "\n")
 
         if current_error:
             error_msg += (
                 "Detected variable names with too many underscores."
                 "Underscores are only allowed for the variable Data:\n")
-            error_msg += current_error
+            error_msg += "".join(current_error)
 
         # check reserved names
-        current_error = ""
+        current_error = []
         for key in keys:
 
             # AES69 Sec. 4.7.1
             if key.startswith("PRIVATE") or key.startswith("API"):
-                current_error += "- " + key + "\n"
+                current_error.append("- " + key + "\n")
             if (key.startswith("GLOBAL") and not key.startswith("GLOBAL_")) or\
                     (key.startswith("GLOBAL") and
                      self._convention[key]["type"] != "attribute"):
-                current_error += "- " + key + "\n"
+                current_error.append("- " + key + "\n")
 
         if current_error:
             error_msg += (
                 "Detected variable or attribute with reserved key words "
                 "PRIVATE, API, or GLOBAL:\n")
-            error_msg += current_error
+            error_msg += "".join(current_error)
 
         # check names of custom data (shall not have the same name as
         # normative data contained in the convention AES69-2022 Sec. 5.3)
-        current_error = ""
+        current_error = []
         if hasattr(self, "_custom"):
 
             # get normative variables and attributes
-            normative = sf.Sofa(
+            normative = _normative_keys(*_convention_file(
                 self.GLOBAL_SOFAConventions,
-                version=self.GLOBAL_SOFAConventionsVersion)._convention.keys()
-            normative = [n.replace("GLOBAL_", "") for n in normative]
+                self.GLOBAL_SOFAConventionsVersion))
 
             # compare against custom
             for key in self._custom.keys():
                 if key.replace("GLOBAL_", "") in normative:
-                    current_error += "- " + key + "\n"
+                    current_error.append("- " + key + "\n")
 
         if current_error:
             error_msg += (
                 "Detected custom variable or attribute with reserved names. "
                 "Custom data shall not have the same name as data contained in"
                 " the convention itself:\n")
-            error_msg += current_error
+            error_msg += "".join(current_error)
 
         # ---------------------------------------------------------------------
         # 4. Get dimensions (E, R, M, N, S, c, I, and custom)
@@ -1178,33 +1199,39 @@ class Sofa():
         self._api = {}
         self.protected = True
 
-        # get keys for checking the dimensions (all SOFA variables)
-        keys = [key for key in self.__dict__.keys()
-                if key in self._convention
-                and self._convention[key]["dimensions"] is not None]
-        if hasattr(self, "_custom"):
-            keys_custom = [key for key in self._custom.keys()
-                           if not key.startswith("_")
-                           and self._custom[key]["dimensions"] is not None]
-            keys += keys_custom
-
+        # get possible dimensions and type for checking the dimensions of all
+        # SOFA variables. Custom variables are contained in self._convention
+        # at this point.
+        # - dimensions are given as string, e.g., 'mRN', or 'IC, MC'
+        variables = {
+            key: (self._convention[key]["dimensions"].split(", "),
+                  self._convention[key]["type"])
+            for key in data.keys() if key in self._convention
+            and self._convention[key]["dimensions"] is not None}
+
+        # sizes and shapes of string data are kept for the next step
         S = 0
-        for key in keys:
+        strings = {}
+        for key, (dimensions, _) in variables.items():
 
-            value = getattr(self, key)
-            dimensions = self._convention[key]["dimensions"]
+            value = data[key]
+            shape = None
 
-            # - dimensions are given as string, e.g., 'mRN', or 'IC, MC'
             # - defined by lower case letters in `dimensions`
-            for idx, dim in enumerate(dimensions.split(", ")[0]):
+            for idx, dim in enumerate(dimensions[0]):
                 if dim not in "ICS" and dim.islower():
-                    # numeric data
-                    self._api[dim.upper()] = \
-                        _nd_newaxis(value, 4).shape[idx]
+                    # numeric data. Get the shape once per key with
+                    # singleton dimensions appended to obtain four
+                    # dimensions (an array is not created)
+                    if shape is None:
+                        shape = np.shape(value)
+                        shape += (1, ) * (4 - len(shape))
+                    self._api[dim.upper()] = shape[idx]
                 if dim == "S":
                     # string data
-                    S = max(S, np.max(self._get_size_and_shape_of_string_var(
-                        value, key)[0]))
+                    strings[key] = self._get_size_and_shape_of_string_var(
+                        value, key)
+                    S = max(S, strings[key][0])
 
         # add fixed sizes
         self._api["C"] = 3
@@ -1213,32 +1240,33 @@ class Sofa():
 
         # ---------------------------------------------------------------------
         # 5. verify dimensions of data
-        current_error = ""
-        for key in keys:
+        current_error = []
+        for key, (dimensions, dtype) in variables.items():
 
-            # handle dimensions
-            dimensions = self._convention[key]["dimensions"]
-            dtype = self._convention[key]["type"]
-
-            # get value and actual shape
-            try:
-                value = getattr(self, key).copy()
-            except AttributeError:
-                value = getattr(self, key)
+            # get value and actual shape (the value is not changed and thus
+            # not copied)
+            value = data[key]
 
             if dtype in ["attribute", "string"]:
-                # string or string array like data
-                shape_act = self._get_size_and_shape_of_string_var(
-                    value, key)[1]
-            elif len(dimensions.split(",")[0]) > 1:
-                # multidimensional array like data
-                shape_act = _atleast_nd(value, 4).shape
+                # string or string array like data (the shape of string
+                # variables is known from step 4)
+                shape_act = strings[key][1] if key in strings else \
+                    self._get_size_and_shape_of_string_var(value, key)[1]
+            elif len(dimensions[0].split(",")[0]) > 1:
+                # multidimensional array like data. Get the shape as returned
+                # by _atleast_nd(value, 4) without creating an array, i.e.,
+                # prepend a dimension to 0d and 1d data and append dimensions
+                # to obtain four dimensions.
+                shape_act = np.shape(value)
+                if len(shape_act) < 2:
+                    shape_act = (1, ) + shape_act
+                shape_act += (1, ) * (4 - len(shape_act))
             else:
                 # scalar of single dimensional array like data
-                shape_act = (np.array(value).size, )
+                shape_act = (np.size(value), )
 
             shape_matched = False
-            for dim in dimensions.split(", "):
+            for dim in dimensions:
 
                 # get the reference shape ('S' translates to a shape of 1,
                 # because the strings are stored in an array whose shape does
@@ -1261,39 +1289,40 @@ class Sofa():
             if not shape_matched:
                 # get possible dimensions in verbose form, i.e., "(M=2, C=3)""
                 dimensions_verbose = []
-                for dim in dimensions.upper().replace(" ", "").split(","):
+                for dim in ",".join(dimensions).upper().split(","):
                     dimensions_verbose.append(
                         f"({', '.join([f'{d}={self._api[d]}' for d in dim])})")
 
-                current_error += (
+                current_error.append(
                     f"- {key} has shape {shape_compare} but must "
                     f"have {', '.join(dimensions_verbose)}\n")
 
         if current_error:
             error_msg += "Detected variables of wrong shape:\n"
-            error_msg += current_error
+            error_msg += "".join(current_error)
 
         # ---------------------------------------------------------------------
         # 6. check restrictions on the content of SOFA files
         rules, unit_aliases, deprecations, _ = self._verification_rules()
+        to_sofar = _sofar_names()
 
-        current_error = ""
-        for key in rules.keys():
+        # only rules for data contained in the SOFA object must be checked
+        keys = [key for key in rules.keys() if to_sofar[key] in data]
 
-            # convert to sofar format
-            key_sofar = key.replace(".", "_").replace(":", "_")
+        current_error = []
+        for key in keys:
 
-            if not hasattr(self, key_sofar):
-                continue
+            # convert to sofar format
+            key_sofar = to_sofar[key]
 
             # actual and possible values for the current key
-            test = getattr(self, key_sofar)
+            test = data[key_sofar]
             ref = rules[key]["value"]
 
             # test if the value is valid
             if not self._verify_value(test, ref, unit_aliases, key_sofar):
-                current_error += (f"- {key_sofar} is {test} "
-                                  f"but must be {', '.join(ref)}\n")
+                current_error.append(f"- {key_sofar} is {test} "
+                                     f"but must be {', '.join(ref)}\n")
 
             # get lower case value for of test for verifying specific
             # dependencies
@@ -1307,13 +1336,13 @@ class Sofa():
             for key_dep in items:
 
                 # convert key to sofar format
-                key_dep = key_dep.replace(".", "_").replace(":", "_")
+                key_dep = to_sofar[key_dep]
 
                 # check if dependency is contained in SOFA object hard to test,
                 # for mandatory fields (added by sofar by default).
-                if not hasattr(self, key_dep):
-                    current_error += (f"- {key_dep} must be given if "
-                                      f"{key_sofar} is in SOFA object\n")
+                if key_dep not in data:
+                    current_error.append(f"- {key_dep} must be given if "
+                                         f"{key_sofar} is in SOFA object\n")
                     continue
 
             # check specific dependencies
@@ -1340,19 +1369,20 @@ class Sofa():
                                 "_dimensions"][dim]["value_str"]
                         # perform the check
                         if dim_act not in dim_ref:
-                            current_error += \
-                                (f"- Dimension {dim} is of size {dim_act} "
-                                 f"but must be {dim_str} if {key_sofar} "
-                                 f"is {test}\n")
+                            current_error.append(
+                                f"- Dimension {dim} is of size {dim_act} "
+                                f"but must be {dim_str} if {key_sofar} "
+                                f"is {test}\n")
                 else:
 
                     # convert name from NetCDF format to sofar format
-                    key_dep_sofar = key_dep.replace(".", "_").replace(":", "_")
+                    key_dep_sofar = to_sofar[key_dep]
 
                     # check if dependency is contained in SOFA object
-                    if not hasattr(self, key_dep_sofar):
-                        current_error += (f"- {key_dep_sofar} must be given if"
-                                          f" {key_sofar} is {test}\n")
+                    if key_dep_sofar not in data:
+                        current_error.append(
+                            f"- {key_dep_sofar} must be given if"
+                            f" {key_sofar} is {test}\n")
                         continue
 
                     # check if dependency has the correct value
@@ -1360,11 +1390,11 @@ class Sofa():
                         continue
 
                     # convert name from NetCDF format to sofar format
-                    test_dep = getattr(self, key_dep_sofar)
+                    test_dep = data[key_dep_sofar]
 
                     if not self._verify_value(
                             test_dep, ref_dep, unit_aliases, key_dep_sofar):
-                        current_error += (
+                        current_error.append(
                             f"- {key_dep_sofar} is {test_dep} but must be "
                             f"{', '.join(ref_dep)} if {key_sofar} is {test}\n")
 
@@ -1374,17 +1404,17 @@ class Sofa():
         # message can be generated)
 
         if mode == "write":
-            keys = [k for k in self.__dict__.keys() if k.endswith("Units")]
-            for key in keys:
-                unit = getattr(self, key)
+            for key in [k for k in data.keys() if k.endswith("Units")]:
+                unit = data[key]
                 if unit.lower() != unit:
-                    current_error += (f"- {key} is {unit} but must contain "
-                                      "only lower case letters when writing "
-                                      "SOFA files to disk.\n")
+                    current_error.append(
+                        f"- {key} is {unit} but must contain "
+                        "only lower case letters when writing "
+                        "SOFA files to disk.\n")
 
         if current_error:
             error_msg += "Detected violations of the SOFA convention:\n"
-            error_msg += current_error
+            error_msg += "".join(current_error)
 
         # ---------------------------------------------------------------------
         # 8. check deprecations
@@ -1454,12 +1484,10 @@ class Sofa():
                 "At this point, only string data should remain. Please report "
                 "the issue: github.com/pyfar/sofar/issues"))
 
-        # case sensitive check for DataType and SOFAConventions
-        if key in ["GLOBAL_DataType", "GLOBAL_SOFAConventions"]:
-            if test in ref:
-                return True
-            else:
-                return False
+        # case sensitive check for DataType and SOFAConventions (the value was
+        # already compared against the reference values above)
+        if key in ("GLOBAL_DataType", "GLOBAL_SOFAConventions"):
+            return False
 
         # general case insensitive test
         test = test.lower()
@@ -1501,8 +1529,8 @@ class Sofa():
         # Following the SOFA standard AES69, units may be separated by
         # `, ` (comma and space), `,` (comma only), and ` ` (space only).
         # (regexp ', ?' matches ', ' and ',')
-        units_ref = re.split(', ?', ref[0])
-        units_test = re.split(', ?', test)
+        units_ref = _UNIT_SEPARATOR.split(ref[0])
+        units_test = _UNIT_SEPARATOR.split(test)
 
         # check if number of units agree
         if len(units_ref) != len(units_test):
@@ -1541,7 +1569,7 @@ class Sofa():
         # Following the SOFA standard AES69, units may be separated by
         # `, ` (comma and space), `,` (comma only), and ` ` (space only).
         # (regexp ', ?' matches ', ' and ',')
-        units_test = re.split(', ?| ', test.lower())
+        units_test = _UNIT_SEPARATOR_SPACE.split(test.lower())
 
         # get list of reference units
         units = [unit_aliases[u] for u in units_test]
@@ -1603,25 +1631,44 @@ class Sofa():
             Deprecated conventions and their substitute
         upgrade : dict
             Rules for upgrading deprecated conventions
-        """
 
-        base = os.path.join(
-            os.path.dirname(__file__), "sofa_conventions", "rules")
-
-        with open(os.path.join(base, "rules.json"), "r") as file:
-            rules = json.load(file)
-        with open(os.path.join(base, "unit_aliases.json"), "r") as file:
-            unit_aliases = json.load(file)
-        with open(os.path.join(base, "deprecations.json"), "r") as file:
-            deprecations = json.load(file)
-        with open(os.path.join(base, "upgrade.json"), "r") as file:
-            upgrade = json.load(file)
+        Notes
+        -----
+        The rules are read from disk only once and cached afterwards. The
+        returned dictionaries are thus shared and must not be changed.
+        """
 
-        return rules, unit_aliases, deprecations, upgrade
+        return _load_verification_rules()
 
     def copy(self):
         """Return a copy of the SOFA object."""
-        return deepcopy(self)
+
+        # The data is copied explicitly, because deepcopy(self) is slow for
+        # the convention, which holds many small dictionaries. The entries of
+        # the convention are copied but their values are not changed by sofar
+        # and thus shared.
+        data = {}
+        memo = {}
+        for key, value in self.__dict__.items():
+            if key in ("_convention", "_custom"):
+                data[key] = {k: dict(v) for k, v in value.items()}
+            elif isinstance(value, np.ndarray) and value.dtype != object:
+                data[key] = value.copy()
+            elif value is None or isinstance(
+                    value, (str, bytes, int, float, np.generic, frozenset)):
+                data[key] = value
+            else:
+                data[key] = deepcopy(value, memo)
+
+        # custom entries are shared between _convention and _custom
+        if "_custom" in data:
+            for key, value in data["_custom"].items():
+                if key in data["_convention"]:
+                    data["_convention"][key] = value
+
+        sofa = object.__new__(type(self))
+        sofa.__dict__.update(data)
+        return sofa
 
     def _reset_convention(self):
         """
@@ -1658,7 +1705,8 @@ class Sofa():
             for key in self._custom:
                 self._convention[key] = self._custom[key]
 
-    def _load_convention(self, convention, version):
+    @staticmethod
+    def _load_convention(convention, version):
         """
         Load SOFA convention from json file.
 
@@ -1683,41 +1731,11 @@ class Sofa():
             raise TypeError(("Convention must be a string "
                              f"but is of type {type(convention)}"))
 
-        # get and check path to json file
-        paths = _get_conventions("path")
-        path = [path for path in paths
-                if os.path.basename(path).startswith(convention + "_")]
-
-        if not len(path):
-            raise ValueError(
-                (f"Convention '{convention}' not found. See "
-                 "sofar.list_conventions() for available conventions."))
-
-        # get available versions as strings
-        versions = [p.split('_')[-1][:-5] for p in path]
-
-        # select the correct version
-        if version == "latest":
-            versions = np.array([float(v) for v in versions])
-            path = path[np.argmax(versions)]
-        else:
-            if version not in versions:
-                raise ValueError((
-                    f"Version {version} not found. "
-                    f"Available versions are {versions}"))
-            path = path[versions.index(version)]
-
-        # read convention from json file
-        with open(path, "r") as file:
-            convention = json.load(file)
-
-        # replace ':' and '.' in key names by '_'
-        convention = {
-            key.replace(':', '_'): value for key, value in convention.items()}
-        convention = {
-            key.replace('.', '_'): value for key, value in convention.items()}
+        # read convention from json file (or cache) and return a copy that
+        # can be changed, e.g., when adding custom entries
+        convention = _read_convention(*_convention_file(convention, version))
 
-        return convention
+        return {key: dict(value) for key, value in convention.items()}
 
     def _convention_to_sofa(self, mandatory):
         """
@@ -1729,35 +1747,39 @@ class Sofa():
             Flag to indicate if only mandatory fields are to be included.
         """
 
-        # populate the SOFA file
+        # collect data with default values. The data is added at once,
+        # because the checks in __setattr__ are not required for new data
+        # taken from the convention
+        data = {}
+        mandatory_keys = self._flagged_keys()[0]
+        defaults = _default_values(*_convention_file(
+            self._convention["GLOBAL_SOFAConventions"]["default"],
+            self._convention["GLOBAL_SOFAConventionsVersion"]["default"]))
         for key in self._convention.keys():
 
             # skip optional fields if requested
-            if not self._mandatory(self._convention[key]["flags"]) \
-                    and mandatory:
+            if mandatory and key not in mandatory_keys:
                 continue
 
-            # get the default value
-            default = self._convention[key]["default"]
-            if isinstance(default, list):
-                ndim = len(self._convention[key]["dimensions"].split(", ")[0])
-                default = _atleast_nd(default, ndim)
+            # get the default value (arrays are copied because the cached
+            # defaults are shared)
+            default = defaults[key]
+            if isinstance(default, np.ndarray):
+                default = default.copy()
 
-            # create attribute with default value
-            setattr(self, key, default)
+            data[key] = default
 
         # write API and date specific fields (some read only)
         now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        self.protected = False
-        self.GLOBAL_DateCreated = now
-        self.GLOBAL_DateModified = now
-        self.GLOBAL_APIName = "sofar SOFA API for Python (pyfar.org)"
-        self.GLOBAL_APIVersion = sf.version()
-        self.GLOBAL_ApplicationName = "Python"
-        self.GLOBAL_ApplicationVersion = (
-            f"{platform.python_version()} "
-            f"[{platform.python_implementation()} - "
-            f"{platform.python_compiler()}]")
+        data["GLOBAL_DateCreated"] = now
+        data["GLOBAL_DateModified"] = now
+        data["GLOBAL_APIName"] = "sofar SOFA API for Python (pyfar.org)"
+        data["GLOBAL_APIVersion"] = sf.version()
+        data["GLOBAL_ApplicationName"] = "Python"
+        data["GLOBAL_ApplicationVersion"] = _APPLICATION_VERSION
+
+        # create attributes
+        self.__dict__.update(data)
         self.protected = True
 
     @staticmethod
@@ -1774,18 +1796,83 @@ class Sofa():
         if isinstance(value, str):
             S = len(value)
             shape = (1, 1)
-        elif isinstance(value, list):
-            S = len(max(value, key=len))
-            shape = np.array(value).shape
-        elif isinstance(value, np.ndarray):
-            S = max(np.vectorize(len)(value))
+        elif isinstance(value, list) and value and \
+                all(isinstance(v, str) for v in value):
+            # flat list of strings (no need to convert to numpy array)
+            S = max(map(len, value))
+            shape = (len(value), )
+        elif isinstance(value, (list, np.ndarray)):
+            value = np.asarray(value)
             shape = value.shape
+            if not value.size:
+                S = 0
+            elif value.dtype.kind in ("U", "S"):
+                # get length of all strings at once instead of calling len()
+                S = int(np.max(np.char.str_len(value)))
+            else:
+                S = max(len(v) for v in value.flat)
         else:
             raise TypeError((f"{key} must be a string, numpy string array, "
                              "or list of strings"))
 
         return S, shape
 
+    @staticmethod
+    def _format_value(value):
+        """
+        Convert value to the format used inside SOFA objects. Strings, dicts,
+        and numpy arrays are not changed. Other values are converted to numpy
+        arrays with at least two dimensions or to numpy scalars if they
+        contain a single value.
+        """
+        if not isinstance(value, (str, dict, np.ndarray)):
+            value = np.atleast_2d(value)
+            if value.size == 1:
+                value = value.flatten()[0]
+
+        return value
+
+    def _flagged_keys(self):
+        """
+        Get the names of the mandatory and read only data of the convention.
+
+        The names are cached per convention file. Custom data is never
+        mandatory or read only.
+
+        Returns
+        -------
+        mandatory : frozenset
+            The names of the mandatory variables and attributes.
+        read_only : frozenset
+            The names of the read only variables and attributes.
+        """
+        convention = self._convention.get(
+            "GLOBAL_SOFAConventions", {}).get("default")
+        version = self._convention.get(
+            "GLOBAL_SOFAConventionsVersion", {}).get("default")
+
+        if isinstance(convention, str) and isinstance(version, str):
+            return _flagged_keys(*_convention_file(convention, version))
+
+        # objects without convention, e.g., from read_sofa_as_netcdf
+        mandatory = frozenset(key for key, value in self._convention.items()
+                              if self._mandatory(value["flags"]))
+        read_only = frozenset(key for key, value in self._convention.items()
+                              if self._read_only(value["flags"]))
+        return mandatory, read_only
+
+    def _is_mandatory_key(self, name):
+        """
+        Check if an entry of the SOFA object is mandatory.
+
+        Custom entries are checked by their flags. All other entries are
+        looked up in the cached names of the mandatory data.
+        """
+        if hasattr(self, "_custom") and name in self._custom:
+            return self._mandatory(self._convention[name]["flags"])
+
+        return name in self._flagged_keys()[0]
+
     @staticmethod
     def _mandatory(flags):
         """
@@ -1833,3 +1920,210 @@ class Sofa():
             is_read_only = True
 
         return is_read_only
+
+
+def _clear_convention_cache():
+    """
+    Clear all cached data that is derived from the convention files.
+
+    This is required after the conventions were updated, e.g., by
+    :py:func:`~sofar.update_conventions`.
+    """
+    for cached in (_find_conventions, _index_conventions, _read_convention,
+                   _normative_keys, _flagged_keys, _default_values):
+        cached.cache_clear()
+
+
+def _convention_file(convention, version):
+    """
+    Get the path and modification time of the json file of a SOFA convention.
+
+    Both are the cache key of all data that is derived from the convention.
+    This is the same key as used by _read_convention, so the cached data is
+    updated whenever the json file changes.
+
+    Parameters
+    ----------
+    convention : str
+        The name of the convention, e.g., ``'SimpleFreeFieldHRIR'``.
+    version : str
+        The version of the convention, e.g., ``'1.0'``.
+
+    Returns
+    -------
+    path : str
+        Full path of the json file.
+    mtime : int
+        Modification time of the json file as returned by
+        ``sofar.utils._mtime``.
+    """
+    path = _lookup_convention(convention, version)
+    return path, _mtime(path)
+
+
+@functools.lru_cache(maxsize=32)
+def _normative_keys(path, mtime):
+    """
+    Get the names of the normative data of a SOFA convention.
+
+    The names are cached per convention file, because they are required each
+    time Sofa.verify() is called on a SOFA object that contains custom data.
+
+    Parameters
+    ----------
+    path, mtime : str, int
+        Path and modification time of the json file as returned by
+        :py:func:`_convention_file`.
+
+    Returns
+    -------
+    normative : frozenset
+        The names of the normative variables and attributes. The prefix
+        ``'GLOBAL_'`` is removed from the names of global attributes.
+    """
+    normative = _read_convention(path, mtime).keys()
+    return frozenset(n.replace("GLOBAL_", "") for n in normative)
+
+
+@functools.lru_cache(maxsize=32)
+def _flagged_keys(path, mtime):
+    """
+    Get the names of the mandatory and read only data of a SOFA convention.
+
+    The names are cached per convention file to avoid parsing the flags of
+    all entries each time a SOFA object is created or verified.
+
+    Parameters
+    ----------
+    path, mtime : str, int
+        Path and modification time of the json file as returned by
+        :py:func:`_convention_file`.
+
+    Returns
+    -------
+    mandatory : frozenset
+        The names of the mandatory variables and attributes.
+    read_only : frozenset
+        The names of the read only variables and attributes.
+    """
+    convention = _read_convention(path, mtime)
+    mandatory = frozenset(key for key, value in convention.items()
+                          if Sofa._mandatory(value["flags"]))
+    read_only = frozenset(key for key, value in convention.items()
+                          if Sofa._read_only(value["flags"]))
+    return mandatory, read_only
+
+
+@functools.lru_cache(maxsize=32)
+def _default_values(path, mtime):
+    """
+    Get the default values of a SOFA convention in the format used inside
+    SOFA objects.
+
+    The values are cached per convention file, because converting the
+    defaults to numpy arrays of the correct dimensions is required each time
+    a SOFA object is created. The returned dictionary and arrays are shared
+    and must not be changed.
+
+    Parameters
+    ----------
+    path, mtime : str, int
+        Path and modification time of the json file as returned by
+        :py:func:`_convention_file`.
+
+    Returns
+    -------
+    defaults : dict
+        The default values of all variables and attributes.
+    """
+    convention = _read_convention(path, mtime)
+
+    defaults = {}
+    for key, value in convention.items():
+        default = value["default"]
+        if isinstance(default, list):
+            ndim = len(value["dimensions"].split(", ")[0])
+            default = _atleast_nd(default, ndim)
+        defaults[key] = Sofa._format_value(default)
+
+    return defaults
+
+
+@functools.lru_cache(maxsize=1)
+def _load_verification_rules():
+    """
+    Read the verification rules from disk. See Sofa._verification_rules().
+    """
+
+    base = os.path.join(
+        os.path.dirname(__file__), "sofa_conventions", "rules")
+
+    with open(os.path.join(base, "rules.json"), "r") as file:
+        rules = json.load(file)
+    with open(os.path.join(base, "unit_aliases.json"), "r") as file:
+        unit_aliases = json.load(file)
+    with open(os.path.join(base, "deprecations.json"), "r") as file:
+        deprecations = json.load(file)
+    with open(os.path.join(base, "upgrade.json"), "r") as file:
+        upgrade = json.load(file)
+
+    return rules, unit_aliases, deprecations, upgrade
+
+
+@functools.lru_cache(maxsize=64)
+def _read_convention(path, mtime):  # noqa: ARG001
+    """
+    Read SOFA convention from json file and replace ':' and '.' in key names
+    by '_'.
+
+    The convention is cached. The modification time of the file is part of
+    the cache key to read the convention again after it was updated. The
+    returned dictionary is shared and must not be changed. Use
+    Sofa._load_convention() to get a copy.
+
+    Parameters
+    ----------
+    path : str
+        Full path of the json file.
+    mtime : int
+        Modification time of the json file as returned by
+        ``sofar.utils._mtime``.
+
+    Returns
+    -------
+    convention : dict
+        The SOFA convention as a dictionary
+    """
+    with open(path, "r") as file:
+        convention = json.load(file)
+
+    # replace ':' and '.' in key names by '_'
+    return {key.translate(_TO_SOFAR): value
+            for key, value in convention.items()}
+
+
+@functools.lru_cache(maxsize=1)
+def _sofar_names():
+    """
+    Map the names used in the verification rules to the sofar format.
+
+    The verification rules use the NetCDF format for names of variables and
+    attributes, e.g., ``'Data.SamplingRate:Units'``. sofar uses underscores
+    instead, e.g., ``'Data_SamplingRate_Units'``.
+
+    Returns
+    -------
+    to_sofar : dict
+        The names of all rules and their general and specific dependencies in
+        NetCDF format (keys) and sofar format (values).
+    """
+    rules = _load_verification_rules()[0]
+
+    names = set(rules.keys())
+    for rule in rules.values():
+        names.update(rule.get("general", []))
+        for dependencies in rule.get("specific", {}).values():
+            names.update(dependencies.keys())
+    names.discard("_dimensions")
+
+    return {name: name.translate(_TO_SOFAR) for name in names}
@@ -1,13 +1,25 @@
 """Module for updating the SOFA conventions used in sofar."""
 import contextlib
+import csv
 import os
 import shutil
 import re
 import glob
 import json
-import requests
-from bs4 import BeautifulSoup
+import threading
 from tempfile import TemporaryDirectory
+from concurrent.futures import ThreadPoolExecutor
+from .sofa import _clear_convention_cache
+
+# links in html pages. The directory listings on sofaconventions.org are
+# plain links and do not require a html parser. The href can be in double,
+# single, or no quotes.
+_LINK = re.compile(
+    r"""<a\s[^>]*?href\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s"'>]+))""",
+    re.IGNORECASE)
+
+# numbers in array cells of the csv files are separated by spaces or commas
+_NUMBER_SEPARATOR = re.compile('[ ,]')
 
 
 def update_conventions(conventions_path=None, assume_yes=False):
@@ -50,26 +62,46 @@ def update_conventions(conventions_path=None, assume_yes=False):
         The default is ``False``
     """
 
+    # imported here because importing requests takes longer than importing
+    # the rest of sofar and it is only needed for updating the conventions
+    import requests
+
     # url for parsing and downloading the convention files
     urls = ("https://www.sofaconventions.org/conventions/",
             "https://www.sofaconventions.org/conventions/deprecated/")
-    ext = 'csv'
 
     print(f"Reading SOFA conventions from {urls[0]} ...")
 
     # get file names of conventions from sofaconventions.org
-    page = requests.get(urls[0]).text
-    soup = BeautifulSoup(page, 'html.parser')
-    standardized = [os.path.split(node.get('href'))[1]
-                    for node in soup.find_all('a')
-                    if node.get('href').endswith(ext)]
-    page = requests.get(urls[1]).text
-    soup = BeautifulSoup(page, 'html.parser')
-    deprecated = [os.path.split(node.get('href'))[1]
-                  for node in soup.find_all('a')
-                  if node.get('href').endswith(ext)]
-
-    conventions = standardized + deprecated
+    standardized = _find_csv_links(requests.get(urls[0]).text)
+    deprecated = _find_csv_links(requests.get(urls[1]).text)
+
+    # exclude these conventions
+    conventions = [
+        convention for convention in standardized + deprecated
+        if not convention.startswith(("General_", "GeneralString_"))]
+
+    # download SOFA convention definitions in parallel. This is much faster
+    # than downloading them one after another, because most of the time is
+    # spent waiting for the server. requests.Session is not thread-safe, so
+    # each worker reuses the connection of its own session.
+    local = threading.local()
+    sessions = []
+
+    def download(convention):
+        if not hasattr(local, "session"):
+            local.session = requests.Session()
+            sessions.append(local.session)
+        url = (f"{urls[0]}/{convention}" if convention in standardized
+               else f"{urls[1]}/{convention}")
+        return local.session.get(url).content
+
+    try:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            downloads = list(executor.map(download, conventions))
+    finally:
+        for session in sessions:
+            session.close()
 
     # directory handling
     if conventions_path is None:
@@ -88,27 +120,15 @@ def update_conventions(conventions_path=None, assume_yes=False):
 
     with TemporaryDirectory() as temp:
         os.mkdir(os.path.join(temp, 'deprecated'))
-        for convention in conventions:
-
-            # exclude these conventions
-            if convention.startswith(("General_", "GeneralString_")):
-                continue
+        for convention, data in zip(conventions, downloads):
 
-            # get filename and url
+            # get filename
             is_standardized = convention in standardized
             standardized_csv = os.path.join(conventions_path, convention)
             deprecated_csv = os.path.join(
                     conventions_path, "deprecated", convention)
-            url = (
-                f"{urls[0]}/{convention}"
-                if is_standardized
-                else f"{urls[1]}/{convention}"
-            )
 
-            # download SOFA convention definitions to package directory
-            data = requests.get(url)
-            # remove windows style line breaks and trailing tabs
-            data = data.content.replace(b"\r\n", b"\n").replace(b"\t\n", b"\n")
+            data = _clean_csv(data)
 
             # check if convention needs to be added or updated
             if is_standardized and not os.path.isfile(standardized_csv):
@@ -121,9 +141,7 @@ def update_conventions(conventions_path=None, assume_yes=False):
             if is_standardized and os.path.isfile(standardized_csv):
                 # check for update of a standardized convention
                 with open(standardized_csv, "rb") as file:
-                    data_current = b"".join(file.readlines())
-                    data_current = data_current.replace(
-                        b"\r\n", b"\n").replace(b"\t\n", b"\n")
+                    data_current = _clean_csv(file.read())
                 if data_current != data:
                     updated = True
                     with open(os.path.join(temp, convention), "wb") as file:
@@ -141,9 +159,7 @@ def update_conventions(conventions_path=None, assume_yes=False):
             elif not is_standardized and os.path.isfile(deprecated_csv):
                 # check for update of a deprecated convention
                 with open(deprecated_csv, "rb") as file:
-                    data_current = b"".join(file.readlines())
-                    data_current = data_current.replace(
-                        b"\r\n", b"\n").replace(b"\t\n", b"\n")
+                    data_current = _clean_csv(file.read())
                 if data_current != data:
                     updated = True
                     with open(os.path.join(temp, 'deprecated', convention),
@@ -182,8 +198,14 @@ def update_conventions(conventions_path=None, assume_yes=False):
                 shutil.copy(
                     os.path.join(temp, 'deprecated', convention),
                     os.path.join(conventions_path, 'deprecated', convention))
-            # compile json files from csv file
-            _compile_conventions(conventions_path)
+            # compile json files from csv file (only for conventions that
+            # were added, updated, or deprecated)
+            for convention in update:
+                _compile_convention(os.path.join(conventions_path, convention))
+            for convention in deprecate:
+                _compile_convention(
+                    os.path.join(conventions_path, 'deprecated', convention))
+            _clear_convention_cache()
             print("... done.")
         else:
             print("... conventions already up to date.")
@@ -214,11 +236,26 @@ def _compile_conventions(conventions_path=None):
         glob.glob(os.path.join(conventions_path, "deprecated", "*.csv"))
 
     for csv_file in csv_files:
+        _compile_convention(csv_file)
 
-        # convert SOFA conventions from csv to json
-        convention_dict = _convention_csv2dict(csv_file)
-        with open(f"{csv_file[:-3]}json", 'w') as file:
-            json.dump(convention_dict, file, indent=4)
+    # data derived from the conventions is cached by convention name and
+    # version and must be updated
+    _clear_convention_cache()
+
+
+def _compile_convention(csv_file: str):
+    """
+    Convert a SOFA convention from csv to json. The json file is written next
+    to the csv file.
+
+    Parameters
+    ----------
+    csv_file : str
+        Path to the csv file.
+    """
+    convention_dict = _convention_csv2dict(csv_file)
+    with open(f"{csv_file[:-3]}json", 'w') as file:
+        json.dump(convention_dict, file, indent=4)
 
 
 def _convention_csv2dict(file: str):
@@ -247,19 +284,19 @@ def _convention_csv2dict(file: str):
         `comment`.
     """
 
-    # read the file
+    # read the file and separate lines by tabs. Leading and trailing white
+    # spaces are removed first and quotes have no special meaning.
     # (encoding could be changed to utf-8 after the SOFA conventions repo is
     # clean.)
     with open(file, 'r', encoding="windows-1252") as fid:
-        lines = fid.readlines()
+        lines = list(csv.reader((line.strip() for line in fid),
+                                delimiter="\t", quoting=csv.QUOTE_NONE))
 
     # write into dict
     convention = {}
     for idl, line in enumerate(lines):
 
         try:
-            # separate by tabs
-            line = line.strip().split("\t")
             # parse the line entry by entry
             for idc, cell in enumerate(line):
                 # detect empty cells and leading trailing white spaces
@@ -281,28 +318,12 @@ def _convention_csv2dict(file: str):
                 cell = cell[1:-1]
 
                 if ';' not in cell:
-                    # get rid of white spaces
-                    cell = cell.strip()
-                    cell = cell.replace(' ', ',')
-                    cell = cell.replace(' ', '')
                     # create flat list of integers and floats
-                    numbers = cell.split(',')
-                    cell = [float(n) if '.' in n else int(n) for n in numbers]
+                    cell = _parse_numbers(cell)
                 else:
                     # create a nested list of integers and floats
                     # separate multidimensional arrays
-                    cell = cell.split(';')
-                    cell_nd = [None] * len(cell)
-                    for idx, cc in enumerate(cell):
-                        # get rid of white spaces
-                        cc = cc.strip()
-                        cc = cc.replace(' ', ',')
-                        cc = cc.replace(' ', '')
-                        numbers = cc.split(',')
-                        cell_nd[idx] = [float(n) if '.' in n else int(n)
-                                        for n in numbers]
-
-                    cell = cell_nd
+                    cell = [_parse_numbers(cc) for cc in cell.split(';')]
 
                 # write parsed cell to line
                 line[idc] = cell
@@ -337,22 +358,51 @@ def _convention_csv2dict(file: str):
             for ff, field in enumerate(fields):
                 convention[line[0]][field.lower()] = line[ff + 1]
 
-        except:  # noqa: E722
+        except Exception as error:
             raise ValueError((f"Failed to parse line {idl}, entry {idc} in: "
-                            f"{file}: \n{line}\n")) from None
-
-    # reorder the fields to be nicer to read and understand
-    # 1. Move everything to the end that is not GLOBAL
-    keys = list(convention.keys())
-    for key in keys:
-        if "GLOBAL" not in key:
-            convention[key] = convention.pop(key)
-    # 1. Move Data entries to the end
-    for key in keys:
+                              f"{file}: \n{line}\n{error}")) from None
+
+    # reorder the fields to be nicer to read and understand: GLOBAL entries
+    # first, Data entries last, and everything else in between
+    global_keys = []
+    data_keys = []
+    other_keys = []
+    for key in convention:
         if key.startswith("Data"):
-            convention[key] = convention.pop(key)
+            data_keys.append(key)
+        elif "GLOBAL" in key:
+            global_keys.append(key)
+        else:
+            other_keys.append(key)
+
+    return {key: convention[key]
+            for key in global_keys + other_keys + data_keys}
+
+
+def _clean_csv(data: bytes):
+    """
+    Remove windows style line breaks and trailing tabs from the content of a
+    csv file to compare conventions independent of these differences.
+    """
+    return data.replace(b"\r\n", b"\n").replace(b"\t\n", b"\n")
+
 
-    return convention
+def _find_csv_links(page: str):
+    """
+    Get the file names of all csv files that are linked in a html page, e.g.,
+    the directory listing of https://www.sofaconventions.org/conventions/.
+    """
+    hrefs = ("".join(groups) for groups in _LINK.findall(page))
+    return [os.path.split(href)[1] for href in hrefs if href.endswith(".csv")]
+
+
+def _parse_numbers(cell: str):
+    """
+    Parse array cell without brackets, e.g., '1 0.5' or '1,0.5', to a list
+    of integers and floats.
+    """
+    return [float(n) if '.' in n else int(n)
+            for n in _NUMBER_SEPARATOR.split(cell.strip())]
 
 
 def _check_congruency(save_dir=None, branch="master"):
@@ -372,10 +422,12 @@ def _check_congruency(save_dir=None, branch="master"):
         branch which is used to load conventions from github.
     """
 
+    import requests
+
     # urls for checking which conventions exist
     urls_check = ["https://www.sofaconventions.org/conventions/",
-                  ("https://github.com/sofacoustics/SOFAtoolbox/tree/"
-                   f"{branch}/SOFAtoolbox/conventions/")]
+                  ("https://api.github.com/repos/sofacoustics/SOFAtoolbox/"
+                   f"contents/SOFAtoolbox/conventions?ref={branch}")]
     # urls for loading the convention files
     urls_load = ["https://www.sofaconventions.org/conventions/",
                  ("https://raw.githubusercontent.com/sofacoustics/SOFAtoolbox/"
@@ -392,20 +444,17 @@ def _check_congruency(save_dir=None, branch="master"):
 
     # get file names of conventions from sofaconventions.org
     url = urls_check[0]
-    page = requests.get(url).text
-    soup = BeautifulSoup(page, 'html.parser')
-    sofaconventions = [os.path.split(node.get('href'))[1]
-                       for node in soup.find_all('a')
-                       if node.get('href').endswith(".csv")]
+    sofaconventions = _find_csv_links(requests.get(url).text)
 
     if not sofaconventions:
         raise ValueError(f"Did not find any conventions at {url}")
 
-    # get file names of conventions from github
+    # get file names of conventions from github. The contents API returns a
+    # short json list instead of the html page of the folder (or a dict with
+    # an error message, e.g., if the rate limit is exceeded)
     url = urls_check[1]
-    page = requests.get(url).text
-    sofatoolbox = re.findall(
-        r'"SOFAtoolbox/conventions/([^"]+\.csv)"', page)
+    sofatoolbox = [item["name"] for item in requests.get(url).json()
+                   if isinstance(item, dict) and item["name"].endswith(".csv")]
 
     if not sofatoolbox:
         raise ValueError(f"Did not find any conventions at {url}")
@@ -430,9 +479,7 @@ def _check_congruency(save_dir=None, branch="master"):
 
         # download SOFA convention definitions to package directory
         data = [requests.get(url + convention) for url in urls_load]
-        # remove trailing tabs and windows style line breaks
-        data = [d.content.replace(b"\r\n", b"\n").replace(b"\t\n", b"\n")
-                for d in data]
+        data = [_clean_csv(d.content) for d in data]
 
         # check for equality
         if data[0] != data[1]:
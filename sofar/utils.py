@@ -1,22 +1,33 @@
 """Contains util functions to work with sofar and Sofa objects."""
 import os
 import glob
+import functools
 import numpy as np
-import numpy.testing as npt
 import warnings
 import sofar as sf
 
+# default directory containing the SOFA conventions
+_CONVENTIONS_PATH = os.path.join(
+    os.path.dirname(__file__), "sofa_conventions", "conventions")
+
 
 def version():
     """Return version of sofar and SOFA conventions."""
 
+    return (f"sofar v{sf.__version__} implementing "
+            f"SOFA standard {_sofa_standard_version()}")
+
+
+@functools.lru_cache(maxsize=1)
+def _sofa_standard_version():
+    """
+    Read version of the SOFA standard. The file is read only once, because
+    version() is called each time a SOFA object is created.
+    """
     sofa_conventions = os.path.join(
         os.path.dirname(__file__), "sofa_conventions", 'VERSION')
     with open(sofa_conventions) as file:
-        sofa_conventions = file.readline().strip()
-
-    return (f"sofar v{sf.__version__} implementing "
-            f"SOFA standard {sofa_conventions}")
+        return file.readline().strip()
 
 
 def _verify_convention_and_version(version, convention):
@@ -32,21 +43,13 @@ def _verify_convention_and_version(version, convention):
     """
 
     # check if the convention exists
-    if convention not in _get_conventions("name"):
+    index = _get_convention_index()
+    if convention not in index:
         raise ValueError(
             f"Convention '{convention}' does not exist")
 
-    name_version = _get_conventions("name_version")
-
-    # check which version is wanted
-    version_exists = False
-    for versions in name_version:
-        # check if convention and version match
-        if versions[0] == convention \
-                and str(float(versions[1])) == version:
-            version_exists = True
-
-    if not version_exists:
+    # check if the version exists
+    if not any(str(float(v)) == version for v, _ in index[convention]):
         raise ValueError((
             f"{convention} v{version} is not a valid SOFA Convention."
             "If you are trying to read the data use "
@@ -91,16 +94,15 @@ def _get_conventions(return_type, conventions_path=None):
     """
     # directory containing the SOFA conventions
     if conventions_path is None:
-        conventions_path = os.path.join(
-            os.path.dirname(__file__), "sofa_conventions", 'conventions')
+        conventions_path = _CONVENTIONS_PATH
 
     reg_str = "*.csv" if return_type == "path_source" else "*.json"
 
-    # SOFA convention files
-    standardized = list(glob.glob(os.path.join(conventions_path, reg_str)))
-    deprecated = list(
-        glob.glob(os.path.join(conventions_path, "deprecated", reg_str)))
-    paths = standardized + deprecated
+    # SOFA convention files (the modification times of the folders are
+    # passed to scan the folders again if files were added or removed)
+    mtimes = (_mtime(conventions_path),
+              _mtime(os.path.join(conventions_path, "deprecated")))
+    paths = list(_find_conventions(conventions_path, reg_str, mtimes))
 
     conventions_str = "Available SOFA conventions:\n"
 
@@ -126,6 +128,151 @@ def _get_conventions(return_type, conventions_path=None):
         raise ValueError(f"return_type {return_type} is invalid")
 
 
+def _get_convention_index(conventions_path=None):
+    """
+    Get available SOFA conventions as dictionary.
+
+    Parameters
+    ----------
+    conventions_path : str, optional
+        The path to the the `conventions` folder containing the json files.
+
+    Returns
+    -------
+    index : dict
+        The convention names are the keys. The values are lists of tuples
+        containing the version and full path of the json files sorted by
+        version. The dictionary is cached and must not be changed.
+    """
+    if conventions_path is None:
+        conventions_path = _CONVENTIONS_PATH
+
+    # the modification times of the folders are passed to build the index
+    # again if files were added or removed
+    mtimes = (_mtime(conventions_path),
+              _mtime(os.path.join(conventions_path, "deprecated")))
+    return _index_conventions(conventions_path, mtimes)
+
+
+def _lookup_convention(convention, version="latest", conventions_path=None):
+    """
+    Get the path of the json file of a SOFA convention.
+
+    Parameters
+    ----------
+    convention : str
+        The name of the convention, e.g., ``'SimpleFreeFieldHRIR'``.
+    version : str, optional
+        ``'latest'``
+            Get the latest version
+        str
+            Version string, e.g., ``'1.0'``.
+    conventions_path : str, optional
+        The path to the the `conventions` folder containing the json files.
+
+    Returns
+    -------
+    path : str
+        Full path and file name of the json file.
+    """
+    index = _get_convention_index(conventions_path)
+
+    if convention not in index:
+        raise ValueError(
+            (f"Convention '{convention}' not found. See "
+             "sofar.list_conventions() for available conventions."))
+
+    versions = index[convention]
+
+    # select the correct version
+    if version == "latest":
+        return versions[-1][1]
+    for v, path in versions:
+        if v == version:
+            return path
+    raise ValueError((
+        f"Version {version} not found. "
+        f"Available versions are {[v for v, _ in versions]}"))
+
+
+def _latest_version(convention):
+    """
+    Get the latest version of a SOFA convention, e.g., ``'1.0'``.
+
+    Parameters
+    ----------
+    convention : str
+        The name of the convention, e.g., ``'SimpleFreeFieldHRIR'``.
+
+    Returns
+    -------
+    version : str
+        The latest version.
+    """
+    path = _lookup_convention(convention)
+    return os.path.basename(path).split(sep="_")[1][:-5]
+
+
+@functools.lru_cache(maxsize=16)
+def _index_conventions(conventions_path, mtimes):
+    """
+    Map convention names to versions and paths. See _get_convention_index.
+
+    The result is cached. The modification times of the folders containing
+    the files are part of the cache key as in :py:func:`_find_conventions`.
+    """
+    index = {}
+    for path in _find_conventions(conventions_path, "*.json", mtimes):
+        fileparts = os.path.basename(path).split(sep="_")
+        index.setdefault(fileparts[0], []).append((fileparts[1][:-5], path))
+
+    for versions in index.values():
+        versions.sort(key=lambda v: float(v[0]))
+
+    return index
+
+
+@functools.lru_cache(maxsize=16)
+def _find_conventions(conventions_path, reg_str, mtimes):  # noqa: ARG001
+    """
+    Find standardized and deprecated convention files.
+
+    The result is cached. The modification times of the folders containing
+    the files are part of the cache key to find the files again after the
+    conventions were updated.
+
+    Parameters
+    ----------
+    conventions_path : str
+        The path to the the `conventions` folder.
+    reg_str : str
+        Pattern of the file names, e.g., ``'*.json'``.
+    mtimes : tuple
+        Modification times of the `conventions` and `deprecated` folders as
+        returned by :py:func:`_mtime`.
+
+    Returns
+    -------
+    paths : tuple
+        Full paths and file names of the convention files.
+    """
+    standardized = glob.glob(os.path.join(conventions_path, reg_str))
+    deprecated = glob.glob(
+        os.path.join(conventions_path, "deprecated", reg_str))
+    return tuple(standardized + deprecated)
+
+
+def _mtime(path):
+    """
+    Return modification time of a path in nanoseconds or None if it does not
+    exist. Nanoseconds are used to detect changes that are close in time.
+    """
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
 def equals(sofa_a, sofa_b, verbose=True, exclude=None):
     """
     Compare two SOFA objects against each other.
@@ -156,28 +303,14 @@ def equals(sofa_a, sofa_b, verbose=True, exclude=None):
         ``True`` if sofa_a and sofa_b are identical, ``False`` otherwise.
     """
 
-    is_identical = True
-
     # get and filter keys
-    # ('_*' are SOFA object private variables, '__' are netCDF attributes)
-    keys_a = [k for k in sofa_a.__dict__.keys() if not k.startswith("_")]
-    keys_b = [k for k in sofa_b.__dict__.keys() if not k.startswith("_")]
-
-    if exclude is not None:
-        if exclude.upper() == "GLOBAL":
-            keys_a = [k for k in keys_a if not k.startswith("GLOBAL_")]
-            keys_b = [k for k in keys_b if not k.startswith("GLOBAL_")]
-        elif exclude.upper() == "ATTR":
-            keys_a = [k for k in keys_a if
-                      sofa_a._convention[k]["type"] != "attribute"]
-            keys_b = [k for k in keys_b if
-                      sofa_b._convention[k]["type"] != "attribute"]
-        elif exclude.upper() == "DATE":
-            keys_a = [k for k in keys_a if "Date" not in k]
-            keys_b = [k for k in keys_b if "Date" not in k]
-        else:
-            raise ValueError(
-                f"exclude is {exclude} but must be GLOBAL, DATE, or ATTR")
+    if exclude is not None and \
+            exclude.upper() not in ["GLOBAL", "DATE", "ATTR"]:
+        raise ValueError(
+            f"exclude is {exclude} but must be GLOBAL, DATE, or ATTR")
+
+    keys_a = _equals_keys(sofa_a, exclude)
+    keys_b = _equals_keys(sofa_b, exclude)
 
     # check for equal length
     if len(keys_a) != len(keys_b):
@@ -191,46 +324,104 @@ def equals(sofa_a, sofa_b, verbose=True, exclude=None):
             "not identical: sofa_a and sofa_b do not have the ame attributes",
             verbose)
 
-    # compare the data inside the SOFA object
+    # compare the data inside the SOFA object. The differences are reported
+    # in a single warning
+    differences = []
+    data_a = sofa_a.__dict__
+    data_b = sofa_b.__dict__
     for key in keys_a:
 
         # get data and types
-        a = getattr(sofa_a, key)
-        b = getattr(sofa_b, key)
+        a = data_a[key]
+        b = data_b[key]
         type_a = sofa_a._convention[key]["type"]
         type_b = sofa_b._convention[key]["type"]
 
+        # shared data, e.g., after copying a SOFA object without changing it
+        if a is b and type_a == type_b:
+            continue
+
         # compare attributes
         if type_a == "attribute" and type_b == "attribute":
 
             # compare
             if a != b:
-                is_identical = _equals_raise_warning(
-                    f"not identical: different values for {key}", verbose)
+                differences.append(
+                    f"not identical: different values for {key}")
 
         # compare double variables
         elif type_a == "double" and type_b == "double":
 
-            try:
-                npt.assert_allclose(np.squeeze(a), np.squeeze(b))
-            except AssertionError:
-                is_identical = _equals_raise_warning(
-                    "not identical: different values for {key}", verbose)
+            if not _equals_double(a, b):
+                differences.append(
+                    f"not identical: different values for {key}")
 
         # compare string variables
         elif type_a == "string" and type_b == "string":
-            try:
-                assert np.all(
-                    np.squeeze(a).astype("S") == np.squeeze(b).astype("S"))
-            except AssertionError:
-                is_identical = _equals_raise_warning(
-                    "not identical: different values for {key}", verbose)
+            if not _equals_string(a, b):
+                differences.append(
+                    f"not identical: different values for {key}")
         else:
-            is_identical = _equals_raise_warning(
-                (f"not identical: {key} has different data types "
-                 f"({type_a}, {type_b})"), verbose)
+            differences.append(
+                f"not identical: {key} has different data types "
+                f"({type_a}, {type_b})")
 
-    return is_identical
+        # the first difference decides the result if nothing is reported
+        if differences and not verbose:
+            return False
+
+    if differences:
+        return _equals_raise_warning("\n".join(differences), verbose)
+
+    return True
+
+
+def _equals_keys(sofa, exclude):
+    """
+    Get the names of the data in a SOFA object that are compared by equals.
+    """
+    # ('_*' are SOFA object private variables, '__' are netCDF attributes)
+    exclude = None if exclude is None else exclude.upper()
+    convention = sofa._convention
+
+    return [key for key in sofa.__dict__ if not key.startswith("_") and not (
+        (exclude == "GLOBAL" and key.startswith("GLOBAL_")) or
+        (exclude == "ATTR" and convention[key]["type"] == "attribute") or
+        (exclude == "DATE" and "Date" in key))]
+
+
+def _equals_double(a, b):
+    """
+    Check if double variables are equal.
+
+    Same as ``numpy.testing.assert_allclose`` with default tolerances but
+    without raising an error: Shapes must match after squeezing, unless one
+    value is a scalar, and NaNs in the same places are equal.
+    """
+    a = np.squeeze(a)
+    b = np.squeeze(b)
+
+    if a.shape != b.shape and a.shape != () and b.shape != ():
+        return False
+
+    return bool(np.allclose(a, b, rtol=1e-7, atol=0, equal_nan=True))
+
+
+def _equals_string(a, b):
+    """
+    Check if string variables are equal.
+
+    Shapes must match after squeezing, unless one value is a single string.
+    """
+    a = np.squeeze(a).astype("S")
+    b = np.squeeze(b).astype("S")
+
+    if a.shape == b.shape:
+        return np.array_equal(a, b)
+    if a.shape == () or b.shape == ():
+        return bool(np.all(a == b))
+
+    return False
 
 
 def _equals_raise_warning(message, verbose):
@@ -244,28 +435,16 @@ def _atleast_nd(array, ndim):
     Get numpy array with specified number of dimensions. Dimensions are
     appended at the end if ndim > 3.
     """
-    try:
-        array = array.copy()
-    except AttributeError:
-        array = array
-
-    if ndim == 1:
-        array = np.atleast_1d(array)
-    if ndim == 2:
-        array = np.atleast_2d(array)
-    if ndim >= 3:
-        array = np.atleast_3d(array)
-    for _ in range(ndim - array.ndim):
-        array = array[..., np.newaxis]
-    return array
-
+    array = np.asanyarray(array)
 
-def _nd_newaxis(array, ndim):
-    """Append dimensions to the end of an array until array.ndim == ndim."""
-    array = np.array(array)
+    if array.ndim < ndim:
+        # leading dimension for scalars and one-dimensional arrays as in
+        # np.atleast_2d and np.atleast_3d
+        shape = array.shape
+        if ndim > 1 and len(shape) < 2:
+            shape = (1, ) + shape
+        array = array.reshape(shape + (1, ) * (ndim - len(shape)))
 
-    for _ in range(ndim - array.ndim):
-        array = array[..., np.newaxis]
     return array
 
 
@@ -1,10 +1,10 @@
 import sofar as sf
 from sofar.utils import (_get_conventions,
                          _verify_convention_and_version,
-                         _atleast_nd,
-                         _nd_newaxis)
+                         _atleast_nd)
 from sofar.io import (_format_value_for_netcdf,
-                      _format_value_from_netcdf)
+                      _format_value_from_netcdf,
+                      _chunk_sizes)
 import os
 import pathlib
 from tempfile import TemporaryDirectory
@@ -344,6 +344,65 @@ def test_atleast_nd():
         assert array.ndim == max(2, ndim)
         assert array.flatten() == np.array([1])
 
+    # test that arrays are not copied
+    array = np.zeros((2, 3))
+    assert np.shares_memory(_atleast_nd(array, 4), array)
 
-def test_nd_newaxis():
-    assert _nd_newaxis([1, 2, 3, 4, 5, 6], 2).shape == (6, 1)
+
+def test_write_sofa_compression_small_variables():
+    """Test that only variables of relevant size are compressed."""
+
+    temp_dir = TemporaryDirectory()
+    filename = os.path.join(temp_dir.name, "test.sofa")
+
+    sofa = sf.Sofa('SimpleFreeFieldHRIR')
+    sofa.Data_IR = np.zeros((1, 2, 2048))
+    sf.write_sofa(filename, sofa)
+
+    with Dataset(filename, "r", format="NETCDF4") as file:
+        assert file["Data.IR"].filters()["zlib"]
+        assert not file["ListenerPosition"].filters()["zlib"]
+
+
+@pytest.mark.parametrize(("shape", "itemsize", "chunks"), [
+    ([1, 2, 256], 8, [1, 2, 256]),
+    ([10000, 2, 512], 8, [79, 2, 512]),
+    ([1, 1, 300000], 8, [1, 1, 75000]),
+    ([10000, 3], 1, [10000, 3])])
+def test__chunk_sizes(shape, itemsize, chunks):
+    """Test chunk sizes for compressed variables."""
+    assert _chunk_sizes(shape, itemsize) == chunks
+
+
+def test_read_sofa_single_value_data():
+    """Test that data with a single value is not converted to a scalar."""
+
+    temp_dir = TemporaryDirectory()
+    filename = os.path.join(temp_dir.name, "test.sofa")
+
+    sofa = sf.Sofa("SimpleFreeFieldHRIR")
+    sofa.Data_IR = np.ones((1, 1, 1))
+    sofa.Data_Delay = np.zeros((1, 1))
+    sofa.ReceiverPosition = [0, 0, 0]
+    sf.write_sofa(filename, sofa)
+
+    sofa = sf.read_sofa(filename)
+    assert sofa.Data_IR.shape == (1, 1, 1)
+    assert sofa.Data_Delay.shape == (1, 1)
+    assert np.isscalar(sofa.Data_SamplingRate)
+
+
+def test_read_write_sofa_masked_data():
+    """Test that masked data keeps its mask when writing and reading."""
+
+    temp_dir = TemporaryDirectory()
+    filename = os.path.join(temp_dir.name, "test.sofa")
+
+    sofa = sf.Sofa("SimpleFreeFieldHRIR")
+    mask = [[[False, True, False], [False, False, False]]]
+    sofa.Data_IR = np.ma.masked_array(np.ones((1, 2, 3)), mask=mask)
+    sf.write_sofa(filename, sofa)
+
+    with pytest.warns(UserWarning, match="Entry Data_IR contains missing"):
+        sofa = sf.read_sofa(filename)
+    npt.assert_array_equal(sofa.Data_IR.mask, mask)
@@ -1,6 +1,8 @@
 """Tests for sofar.Sofa (test for Sofa.verifycontained in test_sofa_verify)."""
 import sofar as sf
 import os
+import json
+import shutil
 from tempfile import TemporaryDirectory
 import pytest
 import numpy as np
@@ -47,6 +49,58 @@ def test_create_sofa_object(capfd):
     assert not hasattr(sofa, '_api')
 
 
+def test_convention_is_not_shared():
+    """Conventions are cached but each SOFA object must get its own copy."""
+    sofa_a = sf.Sofa("GeneralTF")
+    sofa_b = sf.Sofa("GeneralTF")
+    assert sofa_a._convention is not sofa_b._convention
+
+    # changing the convention of one object must not change the other
+    sofa_a._convention["ListenerPosition"]["type"] = "int"
+    sofa_a.add_attribute("GLOBAL_Custom", "custom")
+    assert sofa_b._convention["ListenerPosition"]["type"] == "double"
+    assert "GLOBAL_Custom" not in sofa_b._convention
+    assert sf.Sofa("GeneralTF")._convention["ListenerPosition"]["type"] == \
+        "double"
+
+
+def test_default_values_are_not_shared():
+    """Default values are cached but each SOFA object must get a copy."""
+    sofa = sf.Sofa("GeneralTF")
+    sofa.ListenerPosition[0, 0] = 1
+    assert sf.Sofa("GeneralTF").ListenerPosition[0, 0] == 0
+
+
+def test_changed_convention_files_are_used(monkeypatch):
+    """Cached defaults and flags must follow changes in the json files."""
+    with TemporaryDirectory() as tmp:
+        # use a copy of the conventions to not change the package data
+        conventions = os.path.join(tmp, "conventions")
+        shutil.copytree(sf.utils._CONVENTIONS_PATH, conventions)
+        monkeypatch.setattr(sf.utils, "_CONVENTIONS_PATH", conventions)
+
+        sofa = sf.Sofa("GeneralFIR", version="1.0")
+        assert sofa.GLOBAL_References == ""
+        del sofa.GLOBAL_References
+
+        # make an optional attribute mandatory and change its default
+        file = os.path.join(conventions, "GeneralFIR_1.0.json")
+        with open(file) as json_file:
+            convention = json.load(json_file)
+        convention["GLOBAL:References"]["default"] = "changed"
+        convention["GLOBAL:References"]["flags"] = "m"
+        with open(file, "w") as json_file:
+            json.dump(convention, json_file)
+        # make sure the modification time of the file changes
+        os.utime(file, (1, 1))
+
+        sofa = sf.Sofa("GeneralFIR", version="1.0")
+        assert sofa.GLOBAL_References == "changed"
+        with pytest.raises(
+                TypeError, match="GLOBAL_References is a mandatory"):
+            del sofa.GLOBAL_References
+
+
 def test_set_attributes_of_sofa_object():
     sofa = sf.Sofa("GeneralTF")
 
@@ -68,7 +122,7 @@ def test_delete_attribute_from_sofa_object():
     sofa = sf.Sofa("GeneralTF")
 
     # delete optional attribute
-    delattr(sofa, "GLOBAL_ApplicationName")
+    delattr(sofa, "GLOBAL_References")
 
     # delete mandatory attribute
     with pytest.raises(TypeError, match="GLOBAL_Version is a mandatory"):
@@ -79,6 +133,25 @@ def test_delete_attribute_from_sofa_object():
         delattr(sofa, "new")
 
 
+def test_delete_attribute_without_convention():
+    # object without convention
+    sofa = sf.Sofa(None)
+    sofa.add_attribute("GLOBAL_Foo", "x")
+    del sofa.GLOBAL_Foo
+    assert not hasattr(sofa, "GLOBAL_Foo")
+
+    # object read as netCDF (convention name and version are custom data)
+    temp_dir = TemporaryDirectory()
+    filename = os.path.join(temp_dir.name, "test.sofa")
+    sofa = sf.Sofa("SimpleFreeFieldHRIR")
+    sofa.add_attribute("GLOBAL_Foo", "x")
+    sf.write_sofa(filename, sofa)
+
+    sofa = sf.read_sofa_as_netcdf(filename)
+    del sofa.GLOBAL_Foo
+    assert not hasattr(sofa, "GLOBAL_Foo")
+
+
 def test_copy_sofa_object():
     sofa_org = sf.Sofa("GeneralTF")
     sofa_cp = sofa_org.copy()
@@ -86,6 +159,16 @@ def test_copy_sofa_object():
     assert sf.equals(sofa_org, sofa_cp, verbose=False)
     assert id(sofa_org) != id(sofa_cp)
 
+    # data, convention, and custom entries must not be shared
+    sofa_org.add_variable("Temperature", 25.1, "double", "MI")
+    sofa_cp = sofa_org.copy()
+    sofa_cp.ListenerPosition[0, 0] = 1
+    assert sofa_org.ListenerPosition[0, 0] == 0
+    sofa_cp._convention["Temperature"]["type"] = "string"
+    assert sofa_org._convention["Temperature"]["type"] == "double"
+    assert sofa_org._custom["Temperature"]["type"] == "double"
+    assert sofa_cp._custom["Temperature"]["type"] == "string"
+
 
 def test_list_dimensions(capfd):
 
@@ -336,6 +419,18 @@ def test__get_size_and_shape_of_string_var():
     assert S == 5
     assert shape == (2, )
 
+    # test with two-dimensional numpy strings array
+    S, shape = sf.Sofa._get_size_and_shape_of_string_var(
+        np.array([["four", "fivee"], ["six", "seven"]]), "key")
+    assert S == 5
+    assert shape == (2, 2)
+
+    # test with nested list of strings
+    S, shape = sf.Sofa._get_size_and_shape_of_string_var(
+        [["four", "sixsix"], ["one", "two"], ["a", "b"]], "key")
+    assert S == 6
+    assert shape == (3, 2)
+
     # test with wrong type
     with pytest.raises(TypeError, match="key must be a string"):
         sf.Sofa._get_size_and_shape_of_string_var(1, "key")
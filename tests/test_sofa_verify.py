@@ -240,6 +240,8 @@ def test_data_types(capfd):
     sofa.verify()
     sofa.SourceModel = np.array(["test"])
     sofa.verify()
+    sofa.SourceModel = np.array(["test"], dtype="S")
+    sofa.verify()
 
 
 # 3. Verify names of entries --------------------------------------------------
@@ -1,7 +1,9 @@
 import shutil
 import sofar as sf
-from sofar.utils import _get_conventions
-from sofar.update_conventions import _compile_conventions, _check_congruency
+from sofar.utils import _get_conventions, _lookup_convention
+from sofar.sofa import _flagged_keys, _default_values
+from sofar.update_conventions import (
+    _compile_conventions, _check_congruency, _find_csv_links)
 import os
 import json
 from tempfile import TemporaryDirectory
@@ -48,6 +50,52 @@ def test__get_conventions(capfd):
         _get_conventions(return_type="None")
 
 
+def test__lookup_convention():
+
+    # all versions of a convention in the returned order
+    paths = [p for p in _get_conventions("path")
+             if os.path.basename(p).startswith("SimpleFreeFieldHRIR_")]
+    versions = sorted(
+        float(os.path.basename(p).split("_")[1][:-5]) for p in paths)
+
+    # latest version
+    path = _lookup_convention("SimpleFreeFieldHRIR")
+    assert path in paths
+    assert float(os.path.basename(path).split("_")[1][:-5]) == versions[-1]
+
+    # specific version
+    path = _lookup_convention("SimpleFreeFieldHRIR", "1.0")
+    assert os.path.basename(path) == "SimpleFreeFieldHRIR_1.0.json"
+
+    with pytest.raises(ValueError, match="Convention 'invalid' not found"):
+        _lookup_convention("invalid")
+    with pytest.raises(ValueError, match="Version 0.25 not found"):
+        _lookup_convention("SimpleFreeFieldHRIR", "0.25")
+
+
+def test__get_conventions_finds_new_files():
+    """Test that cached conventions are updated if files are added."""
+
+    with TemporaryDirectory() as tmp:
+        assert _get_conventions("name", tmp) == []
+
+        with open(os.path.join(tmp, "Test_1.0.json"), "w") as file:
+            json.dump({}, file)
+        # make sure the modification time of the folder changes
+        os.utime(tmp, (0, 0))
+
+        assert _get_conventions("name", tmp) == ["Test"]
+        assert _lookup_convention("Test", "1.0", tmp) == \
+            os.path.join(tmp, "Test_1.0.json")
+
+        with open(os.path.join(tmp, "Test_2.0.json"), "w") as file:
+            json.dump({}, file)
+        os.utime(tmp, (1, 1))
+
+        assert _lookup_convention("Test", "latest", tmp) == \
+            os.path.join(tmp, "Test_2.0.json")
+
+
 @pytest.mark.parametrize('branch', ['master', 'development'])
 def test__congruency(capfd, branch):
     """
@@ -61,6 +109,28 @@ def test__congruency(capfd, branch):
         warnings.warn(out, Warning, stacklevel=1)
 
 
+def test__find_csv_links():
+    """Test finding csv files in a directory listing without network."""
+    page = (
+        '<html><body><h1>Index of /conventions</h1>\n'
+        '<a href="?C=N;O=D">Name</a>\n'
+        '<a href="/">Parent Directory</a>\n'
+        '<a href="deprecated/">deprecated/</a>\n'
+        '<a href="FreeFieldHRIR_1.0.csv">FreeFieldHRIR_1.0.csv</a>\n'
+        "<a href='GeneralFIR_1.0.csv'>GeneralFIR_1.0.csv</a>\n"
+        '<a href=GeneralTF_2.0.csv>GeneralTF_2.0.csv</a>\n'
+        '<A class="file" HREF = "https://www.sofaconventions.org/'
+        'conventions/SimpleFreeFieldHRIR_1.0.csv">link</A>\n'
+        '<a href="GeneralFIR_1.0.json">GeneralFIR_1.0.json</a>\n'
+        '<a href="notes.csv.txt">notes.csv.txt</a>\n'
+        '<link href="style.csv">\n'
+        '</body></html>')
+
+    assert _find_csv_links(page) == [
+        "FreeFieldHRIR_1.0.csv", "GeneralFIR_1.0.csv", "GeneralTF_2.0.csv",
+        "SimpleFreeFieldHRIR_1.0.csv"]
+
+
 def test_update_conventions(capfd):
 
     # create temporary directory and copy existing conventions
@@ -135,8 +205,11 @@ def test__compile_conventions():
                      "sofa_conventions", "conventions"),
         os.path.join(temp_dir.name, "conventions"))
 
-    # compile conventions
+    # compile conventions (creating a SOFA object fills the caches)
+    sf.Sofa("SimpleFreeFieldHRIR")
     _compile_conventions(os.path.join(temp_dir.name, "conventions"))
+    assert _flagged_keys.cache_info().currsize == 0
+    assert _default_values.cache_info().currsize == 0
 
     # get list of reference json files
     paths_ref = _get_conventions("path")
@@ -220,6 +293,20 @@ def test_equals_global_parameters():
     assert is_identical
 
 
+def test_equals_single_warning():
+    """Test that all differences are reported in a single warning."""
+    sofa_a = sf.Sofa("SimpleFreeFieldHRIR")
+    sofa_b = sofa_a.copy()
+    sofa_b.Data_IR = [1, 0, 0]
+    sofa_b.GLOBAL_Comment = "different"
+
+    with pytest.warns(UserWarning) as record:
+        assert not sf.equals(sofa_a, sofa_b)
+    assert len(record) == 1
+    assert "Data_IR" in str(record[0].message)
+    assert "GLOBAL_Comment" in str(record[0].message)
+
+
 @pytest.mark.parametrize(("value_a", "value_b", "attribute", "fails"), [
     ("1", "2", "GLOBAL_SOFAConventionsVersion", True),
     ([[1, 2]], [1, 2], "Data_IR", False),
@@ -244,7 +331,7 @@ def test_equals_attribute_values(value_a, value_b, attribute, fails):
 
     # compare
     if fails:
-        with pytest.warns(UserWarning):
+        with pytest.warns(UserWarning, match=attribute):
             assert not sf.equals(sofa_a, sofa_b)
     else:
         assert sf.equals(sofa_a, sofa_b)